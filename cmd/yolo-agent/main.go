@@ -1600,7 +1600,7 @@ func (s *mirrorEventSink) Close() {
 type localRunner struct{ dir string }
 
 func (r localRunner) Run(args ...string) (string, error) {
-	cmd := exec.Command(args[0], args[1:]...)
+	cmd := localCommand(args[0], args[1:]...)
 	cmd.Dir = r.dir
 	out, err := cmd.CombinedOutput()
 	return string(out), err
@@ -1609,13 +1609,39 @@ func (r localRunner) Run(args ...string) (string, error) {
 type localGitRunner struct{ dir string }
 
 func (r localGitRunner) Run(name string, args ...string) (string, error) {
-	all := append([]string{name}, args...)
-	cmd := exec.Command(all[0], all[1:]...)
+	cmd := localCommand(name, args...)
 	cmd.Dir = r.dir
 	out, err := cmd.CombinedOutput()
 	return string(out), err
 }
 
+// resolvedCommandPaths caches PATH lookups for the br/git/tk helpers, keyed
+// by name and the PATH they were resolved against.
+var resolvedCommandPaths sync.Map
+
+func localCommand(name string, args ...string) *exec.Cmd {
+	path := resolveCommandPath(name)
+	cmd := exec.Command(path, args...)
+	cmd.Args[0] = name
+	return cmd
+}
+
+func resolveCommandPath(name string) string {
+	if strings.ContainsRune(name, filepath.Separator) {
+		return name
+	}
+	key := name + "\x00" + os.Getenv("PATH")
+	if path, ok := resolvedCommandPaths.Load(key); ok {
+		return path.(string)
+	}
+	path, err := exec.LookPath(name)
+	if err != nil {
+		return name
+	}
+	resolvedCommandPaths.Store(key, path)
+	return path
+}
+
 func defaultConfigRoot() string {
 	home, err := os.UserHomeDir()
 	if err != nil {
@@ -363,6 +363,30 @@ func TestBuildRunnerAdapterUsesServeAdapterForOpencodeServeBackend(t *testing.T)
 	}
 }
 
+func TestLocalCommandResolvesHelperAgainstCurrentPath(t *testing.T) {
+	firstDir := t.TempDir()
+	secondDir := t.TempDir()
+	for _, dir := range []string{firstDir, secondDir} {
+		if err := os.WriteFile(filepath.Join(dir, "yolo-fake-helper"), []byte("#!/bin/sh\necho ok\n"), 0o755); err != nil {
+			t.Fatalf("write fake helper: %v", err)
+		}
+	}
+
+	t.Setenv("PATH", firstDir)
+	cmd := localCommand("yolo-fake-helper", "--flag")
+	if cmd.Path != filepath.Join(firstDir, "yolo-fake-helper") {
+		t.Fatalf("expected helper resolved from first PATH, got %q", cmd.Path)
+	}
+	if !reflect.DeepEqual(cmd.Args, []string{"yolo-fake-helper", "--flag"}) {
+		t.Fatalf("expected argv to keep the bare helper name, got %#v", cmd.Args)
+	}
+
+	t.Setenv("PATH", secondDir)
+	if got := localCommand("yolo-fake-helper").Path; got != filepath.Join(secondDir, "yolo-fake-helper") {
+		t.Fatalf("expected helper re-resolved after PATH change, got %q", got)
+	}
+}
+
 func TestBuildRunnerAdapterUsesCodexAppServerAndCodexCLIFallback(t *testing.T) {
 	repoRoot := t.TempDir()
 	binDir := t.TempDir()
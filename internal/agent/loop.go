@@ -96,6 +96,11 @@ type Loop struct {
 	workerStartHook func(workerID int)
 }
 
+type taskCloneResult struct {
+	path string
+	err  error
+}
+
 type taskConcurrencyCalculator interface {
 	CalculateConcurrency(ctx context.Context, maxWorkers int) (int, error)
 }
@@ -312,6 +317,27 @@ func (l *Loop) runTask(ctx context.Context, taskID string, workerID int, queuePo
 		epicID = strings.TrimSpace(l.options.ParentID)
 	}
 
+	// Start the per-task clone now so the git clone overlaps the quality and
+	// TDD gates instead of running after them. Paths that leave before the
+	// clone is collected below wait for it and discard it.
+	var cloneDone chan taskCloneResult
+	cloneCollected := false
+	if l.cloneManager != nil {
+		cloneDone = make(chan taskCloneResult, 1)
+		go func() {
+			clonePath, cloneErr := l.cloneManager.CloneForTask(ctx, task.ID, l.options.RepoRoot)
+			cloneDone <- taskCloneResult{path: clonePath, err: cloneErr}
+		}()
+		defer func() {
+			if cloneCollected {
+				return
+			}
+			if result := <-cloneDone; result.err == nil {
+				_ = l.cloneManager.Cleanup(task.ID)
+			}
+		}()
+	}
+
 	if blocked, err := l.runQualityGate(ctx, task, worker, queuePos); err != nil {
 		return summary, err
 	} else if blocked {
@@ -384,12 +410,13 @@ func (l *Loop) runTask(ctx context.Context, taskID string, workerID int, queuePo
 		}
 	}
 
-	if l.cloneManager != nil {
-		clonePath, cloneErr := l.cloneManager.CloneForTask(ctx, task.ID, l.options.RepoRoot)
-		if cloneErr != nil {
-			return summary, cloneErr
+	if cloneDone != nil {
+		result := <-cloneDone
+		cloneCollected = true
+		if result.err != nil {
+			return summary, result.err
 		}
-		taskRepoRoot = clonePath
+		taskRepoRoot = result.path
 		defer func() {
 			if cleanupErr := l.cloneManager.Cleanup(task.ID); cleanupErr != nil && err == nil {
 				err = cleanupErr
@@ -3947,6 +3947,55 @@ func TestLoopUsesIsolatedClonePerTaskAndCleansUp(t *testing.T) {
 	}
 }
 
+func TestLoopCleansUpBackgroundCloneWhenTDDGateBlocks(t *testing.T) {
+	mgr := newFakeTaskManager(contracts.Task{ID: "t-1", Title: "Task 1", Status: contracts.TaskStatusOpen})
+	run := &fakeRunner{results: []contracts.RunnerResult{{Status: contracts.RunnerResultCompleted}}}
+	cloneMgr := newFakeCloneManager()
+	cloneMgr.cloneDelay = 50 * time.Millisecond
+	loop := NewLoop(mgr, run, nil, LoopOptions{ParentID: "root", TDDMode: true, RepoRoot: t.TempDir()})
+	loop.cloneManager = cloneMgr
+
+	summary, err := loop.Run(context.Background())
+	if err != nil {
+		t.Fatalf("loop failed: %v", err)
+	}
+	if summary.Blocked != 1 {
+		t.Fatalf("expected blocked summary, got %#v", summary)
+	}
+	if len(run.requests) != 0 {
+		t.Fatalf("expected no runner requests when blocked by tdd tests-first gate, got %d", len(run.requests))
+	}
+	if got := cloneMgr.CleanupCountFor("t-1"); got != 1 {
+		t.Fatalf("expected exactly one clone cleanup for blocked task, got %d", got)
+	}
+	if got := cloneMgr.CleanupCount(); got != 1 {
+		t.Fatalf("expected no cleanup for other tasks, got %d", got)
+	}
+}
+
+func TestLoopSkipsCleanupWhenBackgroundCloneFailsAndTDDGateBlocks(t *testing.T) {
+	mgr := newFakeTaskManager(contracts.Task{ID: "t-1", Title: "Task 1", Status: contracts.TaskStatusOpen})
+	run := &fakeRunner{results: []contracts.RunnerResult{{Status: contracts.RunnerResultCompleted}}}
+	cloneMgr := newFakeCloneManager()
+	cloneMgr.cloneErr = errors.New("clone failed")
+	loop := NewLoop(mgr, run, nil, LoopOptions{ParentID: "root", TDDMode: true, RepoRoot: t.TempDir()})
+	loop.cloneManager = cloneMgr
+
+	summary, err := loop.Run(context.Background())
+	if err != nil {
+		t.Fatalf("expected gate block to win over discarded clone error, got %v", err)
+	}
+	if summary.Blocked != 1 {
+		t.Fatalf("expected blocked summary, got %#v", summary)
+	}
+	if len(run.requests) != 0 {
+		t.Fatalf("expected no runner requests, got %d", len(run.requests))
+	}
+	if got := cloneMgr.CleanupCount(); got != 0 {
+		t.Fatalf("expected no cleanup for a clone that never succeeded, got %d", got)
+	}
+}
+
 func TestLoopUsesRealCloneManagerForParallelTasksAndCleansUpWorktrees(t *testing.T) {
 	if _, err := exec.LookPath("git"); err != nil {
 		t.Skip("git is required")
@@ -4492,6 +4541,8 @@ func (r *parallelBlockingRepoRunner) RepoRootsByTask() map[string]string {
 type fakeCloneManager struct {
 	mu          sync.Mutex
 	cleanupByID map[string]int
+	cloneDelay  time.Duration
+	cloneErr    error
 }
 
 func newFakeCloneManager() *fakeCloneManager {
@@ -4499,9 +4550,21 @@ func newFakeCloneManager() *fakeCloneManager {
 }
 
 func (f *fakeCloneManager) CloneForTask(_ context.Context, taskID string, _ string) (string, error) {
+	if f.cloneDelay > 0 {
+		time.Sleep(f.cloneDelay)
+	}
+	if f.cloneErr != nil {
+		return "", f.cloneErr
+	}
 	return fmt.Sprintf("/tmp/clone/%s", taskID), nil
 }
 
+func (f *fakeCloneManager) CleanupCountFor(taskID string) int {
+	f.mu.Lock()
+	defer f.mu.Unlock()
+	return f.cleanupByID[taskID]
+}
+
 func (f *fakeCloneManager) Cleanup(taskID string) error {
 	f.mu.Lock()
 	defer f.mu.Unlock()
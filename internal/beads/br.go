@@ -3,6 +3,7 @@ package beads
 import (
 	"os"
 	"path/filepath"
+	"sync"
 )
 
 // RustAdapter provides beads_rust (br) CLI integration
@@ -10,6 +11,10 @@ import (
 // See: https://github.com/Dicklesworthstone/beads_rust
 type RustAdapter struct {
 	runner Runner
+	// writeMu serialises mutating br invocations. Parallel loop workers share
+	// one adapter, and concurrent br writers would otherwise contend on the
+	// SQLite database and its JSONL export.
+	writeMu sync.Mutex
 }
 
 type brDependency struct {
@@ -23,6 +28,13 @@ func (a *RustAdapter) run(args ...string) (string, error) {
 	return a.runner.Run(command...)
 }
 
+// runWrite runs a br command that mutates the issue database.
+func (a *RustAdapter) runWrite(args ...string) (string, error) {
+	a.writeMu.Lock()
+	defer a.writeMu.Unlock()
+	return a.run(args...)
+}
+
 func (a *RustAdapter) Dependencies(id string) ([]brDependency, error) {
 	output, err := a.run("dep", "list", id, "--json")
 	if err != nil {
@@ -169,7 +181,7 @@ func (a *RustAdapter) Show(id string) (Bead, error) {
 
 // UpdateStatus updates the status of an issue
 func (a *RustAdapter) UpdateStatus(id string, status string) error {
-	_, err := a.run("update", id, "--status", status)
+	_, err := a.runWrite("update", id, "--status", status)
 	return err
 }
 
@@ -182,26 +194,26 @@ func (a *RustAdapter) UpdateStatusWithReason(id string, status string, reason st
 	if sanitized == "" {
 		return nil
 	}
-	_, err := a.run("update", id, "--notes", sanitized)
+	_, err := a.runWrite("update", id, "--notes", sanitized)
 	return err
 }
 
 // Close closes an issue
 func (a *RustAdapter) Close(id string) error {
-	_, err := a.run("close", id)
+	_, err := a.runWrite("close", id)
 	return err
 }
 
 // CloseEligible closes epics that have all children closed
 func (a *RustAdapter) CloseEligible() error {
-	_, err := a.run("epic", "close-eligible")
+	_, err := a.runWrite("epic", "close-eligible")
 	return err
 }
 
 // Sync exports database to JSONL for git
 // Note: br requires --flush-only flag unlike bd
 func (a *RustAdapter) Sync() error {
-	_, err := a.run("sync", "--flush-only")
+	_, err := a.runWrite("sync", "--flush-only")
 	return err
 }
 
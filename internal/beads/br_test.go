@@ -2,10 +2,13 @@ package beads
 
 import (
 	"context"
+	"fmt"
 	"os"
 	"path/filepath"
 	"strings"
+	"sync"
 	"testing"
+	"time"
 
 	"github.com/egv/yolo-runner/v2/internal/contracts"
 	"github.com/egv/yolo-runner/v2/internal/engine"
@@ -67,6 +70,25 @@ func TestRustAdapterTreeWrapsSingleReadyChildUnderRoot(t *testing.T) {
 	assertCall(t, runner.calls, []string{"br", "--no-daemon", "ready", "--parent", "root", "--recursive", "--json"})
 }
 
+func TestNextTasksUsesReadyTitlesWithoutShowCalls(t *testing.T) {
+	runner := &fakeRunner{outputs: []string{
+		`[{"id":"root.1","title":"First Task","issue_type":"task","status":"open","priority":2},{"id":"root.2","title":"Second Task","issue_type":"task","status":"open","priority":1}]`,
+	}}
+	manager := NewTaskManager(runner, "/repo")
+
+	tasks, err := manager.NextTasks(context.Background(), "root")
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if len(tasks) != 2 || tasks[0].ID != "root.2" || tasks[0].Title != "Second Task" || tasks[1].Title != "First Task" {
+		t.Fatalf("unexpected tasks: %#v", tasks)
+	}
+	if len(runner.calls) != 1 {
+		t.Fatalf("expected a single br ready call, got %#v", runner.calls)
+	}
+	assertCall(t, runner.calls, []string{"br", "--no-daemon", "ready", "--parent", "root", "--json"})
+}
+
 func TestTaskTreeIncludesSiblingDependencyRelations(t *testing.T) {
 	runner := &fakeRunner{outputs: []string{
 		`[{"id":"root.1","issue_type":"task","status":"open"},{"id":"root.2","issue_type":"task","status":"open"}]`,
@@ -132,3 +154,48 @@ func TestGetTaskTreeFromJSONLRespectsSiblingOrdering(t *testing.T) {
 		t.Fatalf("expected only first task to be ready, got %#v", ready)
 	}
 }
+
+type overlapRunner struct {
+	mu      sync.Mutex
+	active  int
+	overlap bool
+}
+
+func (r *overlapRunner) Run(args ...string) (string, error) {
+	r.mu.Lock()
+	r.active++
+	if r.active > 1 {
+		r.overlap = true
+	}
+	r.mu.Unlock()
+	time.Sleep(time.Millisecond)
+	r.mu.Lock()
+	r.active--
+	r.mu.Unlock()
+	return "", nil
+}
+
+func TestRustAdapterSerializesConcurrentWrites(t *testing.T) {
+	runner := &overlapRunner{}
+	manager := NewTaskManager(runner, "/repo")
+
+	var wg sync.WaitGroup
+	for i := 0; i < 8; i++ {
+		wg.Add(1)
+		go func(i int) {
+			defer wg.Done()
+			taskID := fmt.Sprintf("task-%d", i)
+			if err := manager.SetTaskStatus(context.Background(), taskID, contracts.TaskStatusInProgress); err != nil {
+				t.Errorf("set status: %v", err)
+			}
+			if err := manager.SetTaskData(context.Background(), taskID, map[string]string{"k": "v"}); err != nil {
+				t.Errorf("set data: %v", err)
+			}
+		}(i)
+	}
+	wg.Wait()
+
+	if runner.overlap {
+		t.Fatalf("expected br writes to be serialized")
+	}
+}
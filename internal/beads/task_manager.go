@@ -1,10 +1,11 @@
 package beads
 
 import (
-	"bufio"
 	"context"
 	"encoding/json"
+	"errors"
 	"fmt"
+	"io"
 	"os"
 	"path/filepath"
 	"sort"
@@ -67,15 +68,14 @@ func (m *TaskManager) NextTasks(ctx context.Context, parentID string) ([]contrac
 			return nil, nil
 		}
 
-		// Get title from Show since Issue doesn't have Title field
-		bead, err := m.adapter.Show(issue.ID)
+		title, err := m.issueTitle(issue)
 		if err != nil {
 			return nil, err
 		}
 
 		return []contracts.TaskSummary{{
 			ID:       issue.ID,
-			Title:    bead.Title,
+			Title:    title,
 			Priority: issue.Priority,
 		}}, nil
 	}
@@ -90,15 +90,14 @@ func (m *TaskManager) NextTasks(ctx context.Context, parentID string) ([]contrac
 			continue
 		}
 
-		// Get title from Show
-		bead, err := m.adapter.Show(child.ID)
+		title, err := m.issueTitle(child)
 		if err != nil {
 			continue // Skip if we can't get details
 		}
 
 		tasks = append(tasks, contracts.TaskSummary{
 			ID:       child.ID,
-			Title:    bead.Title,
+			Title:    title,
 			Priority: child.Priority,
 		})
 	}
@@ -114,6 +113,19 @@ func (m *TaskManager) NextTasks(ctx context.Context, parentID string) ([]contrac
 	return tasks, nil
 }
 
+// issueTitle returns the title carried by br ready output, only falling back
+// to a per-issue br show when the ready payload omitted it.
+func (m *TaskManager) issueTitle(issue Issue) (string, error) {
+	if issue.Title != "" {
+		return issue.Title, nil
+	}
+	bead, err := m.adapter.Show(issue.ID)
+	if err != nil {
+		return "", err
+	}
+	return bead.Title, nil
+}
+
 // GetTask retrieves a single task by ID
 func (m *TaskManager) GetTask(ctx context.Context, taskID string) (contracts.Task, error) {
 	bead, err := m.adapter.Show(taskID)
@@ -186,16 +198,15 @@ func (m *TaskManager) getTaskTreeFromJSONL(rootID string) (*contracts.TaskTree,
 
 	issues := make(map[string]issueRecord)
 	childrenByParent := make(map[string][]string)
-	scanner := bufio.NewScanner(file)
-	buf := make([]byte, 0, 64*1024)
-	scanner.Buffer(buf, 2*1024*1024)
-	for scanner.Scan() {
-		line := strings.TrimSpace(scanner.Text())
-		if line == "" {
-			continue
-		}
+	// Decode records straight off the file instead of copying each line
+	// into a string and back into a byte slice.
+	decoder := json.NewDecoder(file)
+	for {
 		var issue issueRecord
-		if err := json.Unmarshal([]byte(line), &issue); err != nil {
+		if err := decoder.Decode(&issue); err != nil {
+			if errors.Is(err, io.EOF) {
+				break
+			}
 			return nil, err
 		}
 		issues[issue.ID] = issue
@@ -205,28 +216,24 @@ func (m *TaskManager) getTaskTreeFromJSONL(rootID string) (*contracts.TaskTree,
 			}
 		}
 	}
-	if err := scanner.Err(); err != nil {
-		return nil, err
-	}
-
 	rootIssue, ok := issues[rootID]
 	if !ok {
 		return nil, fmt.Errorf("root task %q not found in issues.jsonl", rootID)
 	}
 
+	// Only membership matters here; ids are sorted once below, so the walk
+	// uses a plain stack instead of sorting each parent's children.
 	inScope := map[string]struct{}{rootID: {}}
-	queue := []string{rootID}
-	for len(queue) > 0 {
-		current := queue[0]
-		queue = queue[1:]
-		children := append([]string(nil), childrenByParent[current]...)
-		sort.Strings(children)
-		for _, childID := range children {
+	stack := []string{rootID}
+	for len(stack) > 0 {
+		current := stack[len(stack)-1]
+		stack = stack[:len(stack)-1]
+		for _, childID := range childrenByParent[current] {
 			if _, ok := inScope[childID]; ok {
 				continue
 			}
 			inScope[childID] = struct{}{}
-			queue = append(queue, childID)
+			stack = append(stack, childID)
 		}
 	}
 
@@ -422,7 +429,7 @@ func (m *TaskManager) SetTaskData(ctx context.Context, taskID string, data map[s
 
 	for _, key := range keys {
 		value := data[key]
-		if _, err := m.adapter.run("update", taskID, "--notes", key+"="+value); err != nil {
+		if _, err := m.adapter.runWrite("update", taskID, "--notes", key+"="+value); err != nil {
 			return err
 		}
 	}
@@ -1,9 +1,9 @@
 package logging
 
 import (
-	"encoding/json"
 	"os"
 	"path/filepath"
+	"sync"
 )
 
 type ACPRequestEntry struct {
@@ -17,23 +17,90 @@ type ACPRequestEntry struct {
 	Context     string `json:"context,omitempty"`
 }
 
-func AppendACPRequest(logPath string, entry ACPRequestEntry) error {
-	if entry.Component == "" {
-		entry.Component = "opencode"
+// ACPRequestLog appends ACP request entries to a JSONL file, keeping the
+// file open between entries. Each entry is written with a single
+// unbuffered write, so readers see complete lines as soon as Append returns.
+type ACPRequestLog struct {
+	path   string
+	mu     sync.Mutex
+	file   *os.File
+	closed bool
+}
+
+// NewACPRequestLog returns a log that lazily opens logPath on first Append.
+func NewACPRequestLog(logPath string) *ACPRequestLog {
+	return &ACPRequestLog{path: logPath}
+}
+
+// Append writes one entry as a JSON line.
+func (l *ACPRequestLog) Append(entry ACPRequestEntry) error {
+	if l == nil {
+		return nil
 	}
-	entry.LoggingSchemaFields = populateRequiredLogFields(entry.LoggingSchemaFields, entry.IssueID)
-	if err := os.MkdirAll(filepath.Dir(logPath), 0o755); err != nil {
-		return err
+	entry = prepareACPRequest(entry)
+	l.mu.Lock()
+	defer l.mu.Unlock()
+	if l.closed {
+		// Late entries (e.g. ACP updates still draining after the run
+		// returned) are written with a one-shot open so no handle outlives
+		// Close.
+		file, err := l.open()
+		if err != nil {
+			return err
+		}
+		if err := writeJSONLine(file, entry); err != nil {
+			_ = file.Close()
+			return err
+		}
+		return file.Close()
 	}
-	payload, err := json.Marshal(entry)
-	if err != nil {
-		return err
+	if l.file == nil {
+		file, err := l.open()
+		if err != nil {
+			return err
+		}
+		l.file = file
 	}
-	file, err := os.OpenFile(logPath, os.O_APPEND|os.O_CREATE|os.O_WRONLY, 0o644)
-	if err != nil {
-		return err
+	return writeJSONLine(l.file, entry)
+}
+
+// Close releases the underlying file. Close is final: later Appends still
+// write their entry but open and close the file per call.
+func (l *ACPRequestLog) Close() error {
+	if l == nil {
+		return nil
+	}
+	l.mu.Lock()
+	defer l.mu.Unlock()
+	l.closed = true
+	if l.file == nil {
+		return nil
 	}
-	defer file.Close()
-	_, err = file.Write(append(payload, '\n'))
+	err := l.file.Close()
+	l.file = nil
 	return err
 }
+
+func (l *ACPRequestLog) open() (*os.File, error) {
+	if err := os.MkdirAll(filepath.Dir(l.path), 0o755); err != nil {
+		return nil, err
+	}
+	return os.OpenFile(l.path, os.O_APPEND|os.O_CREATE|os.O_WRONLY, 0o644)
+}
+
+func AppendACPRequest(logPath string, entry ACPRequestEntry) error {
+	log := NewACPRequestLog(logPath)
+	if err := log.Append(entry); err != nil {
+		_ = log.Close()
+		return err
+	}
+	return log.Close()
+}
+
+func prepareACPRequest(entry ACPRequestEntry) ACPRequestEntry {
+	if entry.Component == "" {
+		entry.Component = "opencode"
+	}
+	entry.LoggingSchemaFields = populateRequiredLogFields(entry.LoggingSchemaFields, entry.IssueID)
+	return entry
+}
@@ -59,3 +59,40 @@ func TestAppendACPRequestIncludesReasonAndContext(t *testing.T) {
 		t.Fatalf("expected context, got %q", entry["context"])
 	}
 }
+
+func TestACPRequestLogAppendAfterCloseLeavesNoHandleOpen(t *testing.T) {
+	logPath := filepath.Join(t.TempDir(), "nested", "issue-1.jsonl")
+	log := NewACPRequestLog(logPath)
+	for _, message := range []string{"first", "second"} {
+		if err := log.Append(ACPRequestEntry{IssueID: "issue-1", RequestType: "update", Decision: "allow", Message: message}); err != nil {
+			t.Fatalf("append error: %v", err)
+		}
+	}
+	if err := log.Close(); err != nil {
+		t.Fatalf("close error: %v", err)
+	}
+	if err := log.Append(ACPRequestEntry{IssueID: "issue-1", RequestType: "update", Decision: "allow", Message: "third"}); err != nil {
+		t.Fatalf("append after close error: %v", err)
+	}
+	if log.file != nil {
+		t.Fatalf("expected append after close to leave no file handle open")
+	}
+
+	content, err := os.ReadFile(logPath)
+	if err != nil {
+		t.Fatalf("read log: %v", err)
+	}
+	lines := strings.Split(strings.TrimSpace(string(content)), "\n")
+	if len(lines) != 3 {
+		t.Fatalf("expected 3 lines, got %d: %q", len(lines), content)
+	}
+	for i, want := range []string{"first", "second", "third"} {
+		entry := map[string]string{}
+		if err := json.Unmarshal([]byte(lines[i]), &entry); err != nil {
+			t.Fatalf("invalid json: %v", err)
+		}
+		if entry["message"] != want {
+			t.Fatalf("line %d: expected message %q, got %q", i, want, entry["message"])
+		}
+	}
+}
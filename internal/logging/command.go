@@ -1,7 +1,6 @@
 package logging
 
 import (
-	"encoding/json"
 	"errors"
 	"fmt"
 	"os"
@@ -50,7 +49,12 @@ func (cl *CommandLogger) LogCommand(command []string, stdout string, stderr stri
 		return err
 	}
 
-	elapsed := time.Since(startTime).Round(time.Millisecond)
+	// Read the clock once per entry; the timestamp, elapsed time and log
+	// file name are all derived from the same completion instant. Elapsed is
+	// taken before UTC(), which drops the monotonic clock reading.
+	now := time.Now()
+	elapsed := now.Sub(startTime).Round(time.Millisecond)
+	nowUTC := now.UTC()
 	level := "info"
 	status := "ok"
 	if err != nil {
@@ -60,6 +64,7 @@ func (cl *CommandLogger) LogCommand(command []string, stdout string, stderr stri
 
 	entry := CommandLogEntry{
 		LoggingSchemaFields: populateRequiredLogFields(LoggingSchemaFields{
+			Timestamp: nowUTC.Format(time.RFC3339),
 			Level:     level,
 			Component: "runner",
 			TaskID:    "runtime",
@@ -79,26 +84,18 @@ func (cl *CommandLogger) LogCommand(command []string, stdout string, stderr stri
 		entry.Error = err.Error()
 	}
 
-	payload, marshalErr := json.Marshal(entry)
-	if marshalErr != nil {
-		return marshalErr
-	}
-
-	logPath := filepath.Join(cl.logDir, logFileName(command))
+	logPath := filepath.Join(cl.logDir, logFileName(command, nowUTC))
 	logFile, openErr := os.OpenFile(logPath, os.O_APPEND|os.O_CREATE|os.O_WRONLY, 0o644)
 	if openErr != nil {
 		return openErr
 	}
 	defer logFile.Close()
 
-	if _, writeErr := logFile.Write(append(payload, '\n')); writeErr != nil {
-		return writeErr
-	}
-	return nil
+	return writeJSONLine(logFile, entry)
 }
 
-func logFileName(command []string) string {
-	timestamp := time.Now().UTC().Format("20060102_150405_000000")
+func logFileName(command []string, now time.Time) string {
+	timestamp := now.Format("20060102_150405_000000")
 	commandName := strings.Join(command[:min(3, len(command))], "_")
 	commandName = strings.ReplaceAll(commandName, "/", "_")
 	commandName = strings.ReplaceAll(commandName, " ", "_")
@@ -0,0 +1,37 @@
+package logging
+
+import (
+	"bytes"
+	"encoding/json"
+	"io"
+	"sync"
+)
+
+// maxPooledJSONLineBuffer keeps one oversized command log entry (large
+// stdout/stderr captures) from pinning its buffer in the pool.
+const maxPooledJSONLineBuffer = 64 * 1024
+
+var jsonLineBuffers = sync.Pool{
+	New: func() interface{} { return new(bytes.Buffer) },
+}
+
+// writeJSONLine encodes value as a single newline-terminated JSON line and
+// hands it to w in one Write. Encoding into a pooled buffer avoids the
+// per-call result slice from json.Marshal and the reallocation from
+// append(payload, '\n'); the encoder itself is still allocated per call.
+// Output is byte-identical to json.Marshal followed by '\n'.
+func writeJSONLine(w io.Writer, value interface{}) error {
+	buf := jsonLineBuffers.Get().(*bytes.Buffer)
+	buf.Reset()
+	defer func() {
+		if buf.Cap() <= maxPooledJSONLineBuffer {
+			jsonLineBuffers.Put(buf)
+		}
+	}()
+
+	if err := json.NewEncoder(buf).Encode(value); err != nil {
+		return err
+	}
+	_, err := w.Write(buf.Bytes())
+	return err
+}
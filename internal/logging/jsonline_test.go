@@ -0,0 +1,32 @@
+package logging
+
+import (
+	"bytes"
+	"encoding/json"
+	"testing"
+)
+
+func TestWriteJSONLineMatchesMarshalPlusNewline(t *testing.T) {
+	entry := ACPRequestEntry{
+		LoggingSchemaFields: LoggingSchemaFields{Timestamp: "2026-01-22T10:00:00Z", Level: "info", Component: "opencode", TaskID: "t-1", RunID: "t-1"},
+		IssueID:             "t-1",
+		RequestType:         "update",
+		Decision:            "allow",
+		Message:             "<tool> & \"quoted\"",
+	}
+	want, err := json.Marshal(entry)
+	if err != nil {
+		t.Fatalf("marshal: %v", err)
+	}
+	want = append(want, '\n')
+
+	for i := 0; i < 2; i++ {
+		var got bytes.Buffer
+		if err := writeJSONLine(&got, entry); err != nil {
+			t.Fatalf("write json line: %v", err)
+		}
+		if !bytes.Equal(got.Bytes(), want) {
+			t.Fatalf("expected %q, got %q", want, got.Bytes())
+		}
+	}
+}
@@ -1,7 +1,6 @@
 package logging
 
 import (
-	"encoding/json"
 	"fmt"
 	"io"
 	"strings"
@@ -62,13 +61,7 @@ func (l *StructuredLogger) Log(level string, fields map[string]interface{}) erro
 		entry["timestamp"] = time.Now().UTC().Format(time.RFC3339)
 	}
 
-	payload, err := json.Marshal(entry)
-	if err != nil {
-		return err
-	}
-
-	_, err = l.w.Write(append(payload, '\n'))
-	return err
+	return writeJSONLine(l.w, entry)
 }
 
 func parseLevelOrDefault(raw string) logLevel {
@@ -89,18 +89,19 @@ func RedactArgs(args []string) []string {
 	return args
 }
 
-func BuildEnv(baseEnv map[string]string, configRoot string, configDir string, model string) map[string]string {
-	env := map[string]string{}
-	if baseEnv != nil {
-		for key, value := range baseEnv {
-			env[key] = value
-		}
+// staticEnv holds the OpenCode overrides that do not depend on the task,
+// so BuildEnv copies them instead of rebuilding and re-marshalling them
+// for every run.
+var staticEnv = buildStaticEnv()
+
+func buildStaticEnv() map[string]string {
+	env := map[string]string{
+		"OPENCODE_DISABLE_CLAUDE_CODE":        "true",
+		"OPENCODE_DISABLE_CLAUDE_CODE_SKILLS": "true",
+		"OPENCODE_DISABLE_CLAUDE_CODE_PROMPT": "true",
+		"OPENCODE_DISABLE_DEFAULT_PLUGINS":    "true",
+		"CI":                                  "true",
 	}
-	env["OPENCODE_DISABLE_CLAUDE_CODE"] = "true"
-	env["OPENCODE_DISABLE_CLAUDE_CODE_SKILLS"] = "true"
-	env["OPENCODE_DISABLE_CLAUDE_CODE_PROMPT"] = "true"
-	env["OPENCODE_DISABLE_DEFAULT_PLUGINS"] = "true"
-	env["CI"] = "true"
 	// Ensure OpenCode never blocks on permission prompts.
 	permission := map[string]string{
 		"*":                  "allow",
@@ -113,18 +114,26 @@ func BuildEnv(baseEnv map[string]string, configRoot string, configDir string, mo
 	if payload, err := json.Marshal(permission); err == nil {
 		env["OPENCODE_PERMISSION"] = string(payload)
 	}
+	return env
+}
+
+func BuildEnv(baseEnv map[string]string, configRoot string, configDir string, model string) map[string]string {
+	env := make(map[string]string, len(baseEnv)+len(staticEnv)+5)
+	for key, value := range baseEnv {
+		env[key] = value
+	}
+	for key, value := range staticEnv {
+		env[key] = value
+	}
+
+	_ = ensureConfig(configRoot, configDir)
 
 	if configRoot != "" {
-		_ = os.MkdirAll(configRoot, 0o755)
 		env["XDG_CONFIG_HOME"] = configRoot
 	}
 
 	if configDir != "" {
-		_ = os.MkdirAll(configDir, 0o755)
 		configFile := filepath.Join(configDir, "opencode.json")
-		if _, err := os.Stat(configFile); os.IsNotExist(err) {
-			_ = os.WriteFile(configFile, []byte("{}"), 0o644)
-		}
 		env["OPENCODE_CONFIG_DIR"] = configDir
 		env["OPENCODE_CONFIG"] = configFile
 		configContent := map[string]string{}
@@ -141,6 +150,42 @@ func BuildEnv(baseEnv map[string]string, configRoot string, configDir string, mo
 	return env
 }
 
+var initializedConfigs = struct {
+	mu    sync.Mutex
+	paths map[string]struct{}
+}{paths: map[string]struct{}{}}
+
+// ensureConfig creates the config directories and a default opencode.json once
+// per path for the lifetime of the process; later calls skip the filesystem.
+func ensureConfig(configRoot string, configDir string) error {
+	initializedConfigs.mu.Lock()
+	defer initializedConfigs.mu.Unlock()
+
+	if configRoot != "" {
+		if _, ok := initializedConfigs.paths[configRoot]; !ok {
+			if err := os.MkdirAll(configRoot, 0o755); err != nil {
+				return err
+			}
+			initializedConfigs.paths[configRoot] = struct{}{}
+		}
+	}
+	if configDir != "" {
+		configFile := filepath.Join(configDir, "opencode.json")
+		if _, ok := initializedConfigs.paths[configFile]; !ok {
+			if err := os.MkdirAll(configDir, 0o755); err != nil {
+				return err
+			}
+			if _, err := os.Stat(configFile); os.IsNotExist(err) {
+				if err := os.WriteFile(configFile, []byte("{}"), 0o644); err != nil {
+					return err
+				}
+			}
+			initializedConfigs.paths[configFile] = struct{}{}
+		}
+	}
+	return nil
+}
+
 func Run(issueID string, repoRoot string, prompt string, model string, configRoot string, configDir string, logPath string, runner Runner) error {
 	return RunWithACP(context.Background(), issueID, repoRoot, prompt, model, configRoot, configDir, logPath, runner, nil)
 }
@@ -160,21 +205,8 @@ func RunWithACPAndUpdates(ctx context.Context, issueID string, repoRoot string,
 	if runner == nil {
 		return nil
 	}
-	if configRoot != "" {
-		if err := os.MkdirAll(configRoot, 0o755); err != nil {
-			return err
-		}
-	}
-	if configDir != "" {
-		if err := os.MkdirAll(configDir, 0o755); err != nil {
-			return err
-		}
-		configFile := filepath.Join(configDir, "opencode.json")
-		if _, err := os.Stat(configFile); os.IsNotExist(err) {
-			if err := os.WriteFile(configFile, []byte("{}"), 0o644); err != nil {
-				return err
-			}
-		}
+	if err := ensureConfig(configRoot, configDir); err != nil {
+		return err
 	}
 	if logPath == "" {
 		logPath = filepath.Join(repoRoot, "runner-logs", "opencode", issueID+".jsonl")
@@ -204,13 +236,15 @@ func RunWithACPAndUpdates(ctx context.Context, issueID string, repoRoot string,
 			return errors.New("opencode runner does not expose stdin/stdout for ACP")
 		}
 		acpClient = ACPClientFunc(func(ctx context.Context, issueID string, logPath string) error {
+			requestLog := logging.NewACPRequestLog(logPath)
+			defer requestLog.Close()
 			handler := NewACPHandler(issueID, logPath, func(logPath string, issueID string, requestType string, decision string, reason string, context string, detail string) error {
 				if line := forwardACPRequestLine(requestType, decision, detail, onLineUpdate); line != "" {
 					if printACPToConsole {
 						writeConsoleLine(os.Stderr, fmt.Sprintf("ACP[%s] %s", issueID, line))
 					}
 				}
-				return logging.AppendACPRequest(logPath, logging.ACPRequestEntry{
+				return requestLog.Append(logging.ACPRequestEntry{
 					IssueID:     issueID,
 					RequestType: requestType,
 					Decision:    decision,
@@ -233,7 +267,7 @@ func RunWithACPAndUpdates(ctx context.Context, issueID string, repoRoot string,
 				if printACPToConsole && !strings.HasPrefix(line, "⏳") && !strings.HasPrefix(line, "🔄") && !strings.HasPrefix(line, "✅") && !strings.HasPrefix(line, "❌") && !strings.HasPrefix(line, "⚪") {
 					writeConsoleLine(os.Stderr, fmt.Sprintf("ACP[%s] %s", issueID, line))
 				}
-				_ = logging.AppendACPRequest(logPath, logging.ACPRequestEntry{
+				_ = requestLog.Append(logging.ACPRequestEntry{
 					IssueID:     issueID,
 					RequestType: "update",
 					Decision:    "allow",
@@ -80,6 +80,29 @@ func TestBuildEnvSetsModelConfigContent(t *testing.T) {
 	}
 }
 
+func TestBuildEnvInitializesConfigOncePerPath(t *testing.T) {
+	tempDir := t.TempDir()
+	configRoot := filepath.Join(tempDir, "config")
+	configDir := filepath.Join(configRoot, "opencode")
+	configFile := filepath.Join(configDir, "opencode.json")
+
+	BuildEnv(nil, configRoot, configDir, "")
+	if _, err := os.Stat(configFile); err != nil {
+		t.Fatalf("expected opencode.json to exist: %v", err)
+	}
+	if err := os.Remove(configFile); err != nil {
+		t.Fatalf("remove opencode.json: %v", err)
+	}
+
+	env := BuildEnv(nil, configRoot, configDir, "")
+	if _, err := os.Stat(configFile); !os.IsNotExist(err) {
+		t.Fatalf("expected initialized config to be skipped, stat err=%v", err)
+	}
+	if env["OPENCODE_CONFIG"] != configFile {
+		t.Fatalf("expected OPENCODE_CONFIG set, got %q", env["OPENCODE_CONFIG"])
+	}
+}
+
 func TestBuildEnvSetsDeterministicPermissionPolicy(t *testing.T) {
 	env := BuildEnv(nil, "", "", "")
 	raw := strings.TrimSpace(env["OPENCODE_PERMISSION"])